@@ -49,7 +49,7 @@ Example Output:
     Processing file: 10-1009-110_Roughness.png          ⏭️ skipped
 
 Notes:
-    - The script uses `str.ljust()` to align the console output properly.
+    - The script uses a `:<45` format spec to align the console output properly.
     - If a renaming operation fails, the error message is logged.
     - JSON file path, CSV file path, and log file path are output at the end.
     - The script follows PEP8 and PEP257 coding standards.
@@ -57,18 +57,49 @@ Notes:
 
 
 import os
+import re
+import sys
 import json
-import csv
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import ahocorasick
+except ImportError:  # optional dependency, the regex matcher is used instead
+    ahocorasick = None
+
+# Status prefixes for the per-file output
+_OK = "✅ renamed to →"
+_SKIP = "⏭️ skipped"
+_ERR = "❌ Failed:"
+
+# Number of processed files after which buffered output is written
+OUTPUT_BATCH_SIZE = 1000
+
+# Number of threads issuing rename calls in parallel
+RENAME_WORKERS = 16
+
+# Maximum number of directory file descriptors held open per batch
+MAX_OPEN_DIRS = 64
+
+# Rename relative to an open directory fd (renameat) where supported, so
+# the kernel does not resolve the full path again for every file
+USE_DIR_FD = os.rename in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY')
 
 # Load configuration from JSON file
 CONFIG_PATH = r"E:\local_Sebastian\z\PBR_Materials_0010_25\software\python\rename_pbr\rename_path_config.json"
 
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from JSON file."""
+    """Load configuration from JSON file.
+
+    The result is cached and returned as a read-only mapping.
+    """
     with open(CONFIG_PATH, 'r', encoding='utf-8') as file:
         config = json.load(file)
-    return config
+    return MappingProxyType(config)
 
 # Load config into global variables
 config = load_config()
@@ -81,25 +112,32 @@ LOG_FILE = r"{}\{}_rename.log".format(
     datetime.now().strftime('%Y_%m_%d_%H_%M')
 )
 
+@lru_cache(maxsize=1)
 def load_rename_patterns():
-    """Load rename patterns from the CSV file."""
+    """Load rename patterns from the CSV file.
+
+    Returns a tuple of the pattern dictionary and a compiled regex matching
+    any of its keys (longest keys first, so longer patterns win on overlaps).
+    The regex is None if no patterns could be loaded. The result is cached
+    and the pattern dictionary is returned as a read-only mapping.
+    """
     patterns = {}
     try:
         print(f"DEBUG: Trying to open CSV file at: {CONFIG_FILE}")
 
         # Verwende utf-8-sig, um Byte Order Marks (BOM) zu entfernen
-        with open(CONFIG_FILE, newline='', encoding='utf-8-sig') as csvfile:
-            reader = csv.reader(csvfile, delimiter=';')
-            
+        # Plain str.split is sufficient for the two-column file and avoids
+        # the csv tokenizer overhead
+        with open(CONFIG_FILE, encoding='utf-8-sig') as csvfile:
             # ➡️ Überspringe die Kopfzeile der CSV-Datei
-            header = next(reader)
+            header = next(csvfile, '').rstrip('\r\n').split(';')
             print(f"DEBUG: Skipping CSV header: {header}")
 
-            for row in reader:
+            for line in csvfile:
+                row = line.split(';')
                 if len(row) == 2:
-                    old_name = row[0].strip()
-                    new_name = row[1].strip()
-                    patterns[old_name] = new_name
+                    # Values are padded for alignment in the shipped CSV
+                    patterns[row[0].strip()] = row[1].strip()
 
         print("DEBUG: CSV file read successfully ✅")
 
@@ -111,50 +149,204 @@ def load_rename_patterns():
     print("--------------")
     print(patterns)  # Zeigt die geladenen Patterns für Debugging-Zwecke
     print("--------------")
-    return patterns
+
+    regex = None
+    if patterns:
+        regex = re.compile('|'.join(sorted(map(re.escape, patterns), key=len, reverse=True)))
+    return MappingProxyType(patterns), regex
+
+def _build_automaton(patterns):
+    """Build an Aho-Corasick automaton over the rename patterns.
+
+    Returns None if pyahocorasick is not installed or there are no patterns,
+    in which case the compiled regex from load_rename_patterns is used.
+    """
+    if ahocorasick is None or not patterns:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for old_pattern, new_pattern in patterns.items():
+        automaton.add_word(old_pattern, (old_pattern, new_pattern))
+    automaton.make_automaton()
+    return automaton
+
+def _scan_png(root):
+    """Recursively yield DirEntry objects for all PNG files below root.
+
+    Uses os.scandir so the file type comes from the directory listing
+    instead of an extra stat() call per entry. Each directory listing is
+    read completely before yielding, so renaming files while iterating
+    does not affect the listing. Directories that cannot be read (missing,
+    no permission, network errors) are reported and skipped, as os.walk did.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError as e:
+        print(f"❌ Error: cannot access directory '{root}': {e}")
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_png(entry.path)
+        elif entry.is_file(follow_symlinks=False) and entry.name.endswith('.png'):
+            yield entry
+
+def _rename_one(job):
+    """Rename a single file; return the raised exception or None on success.
+
+    job is a tuple (old, new, dir_fd). If dir_fd is None, old and new are
+    full paths, otherwise they are file names relative to dir_fd.
+    """
+    old_name, new_name, dir_fd = job
+    try:
+        os.rename(old_name, new_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+    except Exception as e:
+        return e
+    return None
 
 def rename_files():
     """Rename files based on patterns from the CSV file."""
     rename_count = 0
     skipped_count = 0
-    processed_paths = []
-    patterns = load_rename_patterns()
-
-    with open(LOG_FILE, 'w', encoding='utf-8') as log:
+    processed_dirs = set()
+    patterns, regex = load_rename_patterns()
+    automaton = _build_automaton(patterns)
+
+    # A pattern can only match if its first characters occur in the file
+    # name, so files without any of these anchors skip the matcher entirely
+    anchors = tuple({old_pattern[:4] for old_pattern in patterns})
+
+    def replace_match(match):
+        old_pattern = match.group(0)
+        new_pattern = patterns[old_pattern]
+        match_lines.append(f"   MATCH: '{old_pattern}' → '{new_pattern}'")
+        return new_pattern
+
+    def apply_automaton(file):
+        # Collect all hits in one pass and keep the leftmost-longest,
+        # non-overlapping ones (same result as the regex alternation)
+        hits = sorted(
+            ((end - len(old_pattern) + 1, end + 1, old_pattern, new_pattern)
+             for end, (old_pattern, new_pattern) in automaton.iter(file)),
+            key=lambda hit: (hit[0], -hit[1])
+        )
+        parts = []
+        pos = 0
+        for hit in hits:
+            if hit[0] >= pos:
+                parts.append(hit)
+                pos = hit[1]
+
+        if not parts:
+            return file
+
+        pieces = []
+        pos = 0
+        for start, end, old_pattern, new_pattern in parts:
+            match_lines.append(f"   MATCH: '{old_pattern}' → '{new_pattern}'")
+            pieces.append(file[pos:start])
+            pieces.append(new_pattern)
+            pos = end
+        pieces.append(file[pos:])
+        return ''.join(pieces)
+
+    # Console and log output is buffered and written in batches
+    console_lines = []
+    log_lines = []
+    match_lines = []
+
+    def flush_output():
+        if log_lines:
+            log.write('\n'.join(log_lines) + '\n')
+            log_lines.clear()
+        if console_lines:
+            sys.stdout.write('\n'.join(console_lines) + '\n')
+            console_lines.clear()
+
+    # Renames are collected per batch and run on a thread pool, since each
+    # rename mostly waits on the file system (especially on network shares)
+    batch = []
+    dir_fds = {}
+
+    def get_dir_fd(root):
+        # Open each directory once per batch; None falls back to full paths
+        if root not in dir_fds:
+            try:
+                dir_fds[root] = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                dir_fds[root] = None
+        return dir_fds[root]
+
+    def process_batch():
+        nonlocal rename_count, skipped_count
+        to_rename = [job for _, job, _, _ in batch if job is not None]
+        try:
+            errors = iter(list(executor.map(_rename_one, to_rename)))
+        finally:
+            for dir_fd in dir_fds.values():
+                if dir_fd is not None:
+                    os.close(dir_fd)
+            dir_fds.clear()
+
+        for file, job, new_file_name, matches in batch:
+            console_lines.extend(matches)
+
+            # Create aligned output
+            output = f"Processing file: {file:<45}"
+
+            if job is not None:
+                error = next(errors)
+                if error is None:
+                    rename_count += 1
+                    status_message = f"{_OK} {new_file_name}"
+                else:
+                    status_message = f"{_ERR} {error}"
+            else:
+                skipped_count += 1
+                status_message = _SKIP
+
+            # Queue line for console and log
+            console_lines.append(f"{output}{status_message}")
+            log_lines.append(f"{output}{status_message}")
+
+        batch.clear()
+        flush_output()
+
+    with open(LOG_FILE, 'w', encoding='utf-8', buffering=1 << 20) as log, \
+            ThreadPoolExecutor(max_workers=RENAME_WORKERS) as executor:
         log.write(f"=== Rename process started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ===\n\n")
 
-        for root, _, files in os.walk(SOURCE_DIRECTORY):
-            for file in files:
-                if file.endswith('.png'):
-                    old_path = os.path.join(root, file)
-                    new_file_name = file
-
-                    # Apply rename patterns
-                    for old_pattern, new_pattern in patterns.items():
-                        if old_pattern in new_file_name:
-                            print(f"   MATCH: '{old_pattern}' → '{new_pattern}'")
-                            new_file_name = new_file_name.replace(old_pattern, new_pattern)
-
-                    new_path = os.path.join(root, new_file_name)
-                    processed_paths.append(root)
-
-                    # Create aligned output using str.ljust()
-                    output = f"Processing file: {file.ljust(45)}"
-
-                    if old_path != new_path:
-                        try:
-                            os.rename(old_path, new_path)
-                            rename_count += 1
-                            status_message = f"✅ renamed to → {new_file_name}"
-                        except Exception as e:
-                            status_message = f"❌ Failed: {e}"
-                    else:
-                        skipped_count += 1
-                        status_message = f"⏭️ skipped"
-
-                    # Print and write to log in one line
-                    print(f"{output}{status_message}")
-                    log.write(f"{output}{status_message}\n")
+        for entry in _scan_png(SOURCE_DIRECTORY):
+            file = entry.name
+            root = os.path.dirname(entry.path)
+            new_file_name = file
+
+            # Apply rename patterns in a single pass
+            if any(anchor in file for anchor in anchors):
+                if automaton is not None:
+                    new_file_name = apply_automaton(file)
+                elif regex is not None:
+                    new_file_name = regex.sub(replace_match, file)
+
+            if root not in processed_dirs:
+                processed_dirs.add(root)
+
+            # Only build a rename job for files that actually change
+            job = None
+            if new_file_name != file:
+                dir_fd = get_dir_fd(root) if USE_DIR_FD else None
+                if dir_fd is not None:
+                    job = (file, new_file_name, dir_fd)
+                else:
+                    job = (entry.path, os.path.join(root, new_file_name), None)
+
+            batch.append((file, job, new_file_name, match_lines[:]))
+            match_lines.clear()
+            if len(batch) >= OUTPUT_BATCH_SIZE or len(dir_fds) >= MAX_OPEN_DIRS:
+                process_batch()
+
+        process_batch()
 
         # Write summary to log file
         log.write("\n=== Rename process finished ===\n")
@@ -162,7 +354,7 @@ def rename_files():
         log.write(f"Total files skipped: {skipped_count}\n")
         log.write("\nProcessed directories:\n")
 
-        for path in sorted(set(processed_paths)):
+        for path in sorted(processed_dirs):
             log.write(f"{path}\n")
 
         # Write file locations (including JSON config)
@@ -177,7 +369,7 @@ def rename_files():
         print(f"Total files skipped: {skipped_count}\n")
 
         print("Processed directories:")
-        for path in sorted(set(processed_paths)):
+        for path in sorted(processed_dirs):
             print(f" - {path}")
 
         # Print file locations to console
@@ -187,4 +379,7 @@ def rename_files():
         print(f"Log file: {LOG_FILE}")
 
 if __name__ == "__main__":
+    # Output is written in batches, so line buffering on stdout only costs time
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
     rename_files()
@@ -8,6 +8,7 @@
 #
 # Features:
 # - Allows users to specify a search pattern and replacement text.
+# - Optional regex mode for the search pattern (with group references).
 # - Supports drag and drop for selecting files.
 # - Displays the list of selected files.
 # - Shows a file count of the selected files.
@@ -25,8 +26,72 @@
 
 import sys
 import os
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLineEdit, QPushButton, QTextEdit, QLabel, QFileDialog, QListWidget, QHBoxLayout
-from PyQt5.QtCore import Qt
+import re
+import stat as statmod
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLineEdit, QPushButton, QTextEdit, QLabel, QFileDialog, QListWidget, QHBoxLayout, QCheckBox
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QTextCursor
+
+
+class RenameWorker(QObject):
+    # Renames files in a background thread and reports log lines to the GUI
+    progress = pyqtSignal(list)
+    finished = pyqtSignal(int)
+
+    # Number of log lines collected before they are sent to the GUI
+    PROGRESS_BATCH_SIZE = 100
+
+    def __init__(self, files, pattern, replace, regex=None):
+        super().__init__()
+        self.files = list(files)
+        self.pattern = pattern
+        self.replace = replace
+        self.regex = regex
+
+    @pyqtSlot()
+    def run(self):
+        renamed_count = 0
+        messages = []
+
+        # Renames run on a thread pool; results come back in file order
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for renamed, message in executor.map(self._rename_one, self.files):
+                if renamed:
+                    renamed_count += 1
+                if message:
+                    messages.append(message)
+                if len(messages) >= self.PROGRESS_BATCH_SIZE:
+                    self.progress.emit(messages)
+                    messages = []
+
+        if messages:
+            self.progress.emit(messages)
+        self.finished.emit(renamed_count)
+
+    def _rename_one(self, file_path):
+        # Rename a single file; returns (renamed, log message or None)
+        # Qt returns local files with '/' separators on all platforms
+        folder, sep, filename = file_path.rpartition('/')
+        if not sep:
+            folder, sep, filename = file_path.rpartition(os.sep)
+
+        if self.regex is not None:
+            new_filename = self.regex.sub(self.replace, filename)
+            if new_filename == filename:
+                return False, None
+        elif self.pattern in filename:
+            new_filename = filename.replace(self.pattern, self.replace)
+        else:
+            return False, None
+
+        new_file_path = folder + sep + new_filename
+
+        try:
+            os.rename(file_path, new_file_path)
+            return True, f"Renamed: {filename} ➔ {new_filename}"
+        except Exception as e:
+            return False, f"Failed to rename {filename}: {e}"
 
 
 class FileRenamerApp(QWidget):
@@ -36,6 +101,15 @@ class FileRenamerApp(QWidget):
         self.setGeometry(100, 100, 1024, 1024)  # Set default window size to 1024x1024
 
         self.files = []
+        self._files_set = set()
+
+        # Stripped input values, updated whenever the text changes
+        self._pattern = ""
+        self._replace = ""
+
+        # Background rename thread, set while a rename is running
+        self._rename_thread = None
+        self._rename_worker = None
 
         self.initUI()
 
@@ -53,6 +127,7 @@ class FileRenamerApp(QWidget):
 
         self.pattern_input = QLineEdit(self)
         self.pattern_input.setPlaceholderText("Enter pattern to find:")
+        self.pattern_input.textChanged.connect(self._on_pattern)
         layout.addWidget(self.pattern_input)
 
         replace_label = QLabel("Replace with:", self)
@@ -60,8 +135,12 @@ class FileRenamerApp(QWidget):
 
         self.replace_input = QLineEdit(self)
         self.replace_input.setPlaceholderText("Enter replacement text")
+        self.replace_input.textChanged.connect(self._on_replace)
         layout.addWidget(self.replace_input)
 
+        self.regex_checkbox = QCheckBox("Regex", self)
+        layout.addWidget(self.regex_checkbox)
+
         # Drop area label
         drop_label = QLabel("Please drag your files here...", self)
         drop_label.setStyleSheet("font-size: 16px; margin-top: 10px; margin-bottom: 5px;")
@@ -107,6 +186,12 @@ class FileRenamerApp(QWidget):
 
         self.setLayout(layout)
 
+    def _on_pattern(self, text):
+        self._pattern = text.strip()
+
+    def _on_replace(self, text):
+        self._replace = text.strip()
+
     def dragEnterEvent(self, event):
         # Accept the drag event if it contains file URLs
         if event.mimeData().hasUrls():
@@ -117,11 +202,26 @@ class FileRenamerApp(QWidget):
     def dropEvent(self, event):
         # Handle the file drop event
         urls = event.mimeData().urls()
+        new_files = []
         for url in urls:
             file_path = url.toLocalFile()
-            if os.path.isfile(file_path) and file_path not in self.files:
-                self.files.append(file_path)
-                self.drop_area.addItem(file_path)
+            if file_path in self._files_set:
+                continue
+            # Single stat call; skips directories and missing paths
+            try:
+                mode = os.stat(file_path).st_mode
+            except OSError:
+                continue
+            if statmod.S_ISREG(mode):
+                self._files_set.add(file_path)
+                new_files.append(file_path)
+
+        # Add all new items in one go to avoid a relayout per file
+        if new_files:
+            self.files.extend(new_files)
+            self.drop_area.setUpdatesEnabled(False)
+            self.drop_area.addItems(new_files)
+            self.drop_area.setUpdatesEnabled(True)
 
         self.update_file_count()
 
@@ -134,35 +234,79 @@ class FileRenamerApp(QWidget):
             self.log_output.append("No files to rename.")
             return
 
-        pattern = self.pattern_input.text().strip()
-        replace = self.replace_input.text().strip()
+        pattern = self._pattern
+        replace = self._replace
 
         if not pattern:
             self.log_output.append("Pattern cannot be empty.")
             return
 
-        renamed_count = 0
-        for file_path in self.files:
-            folder = os.path.dirname(file_path)
-            filename = os.path.basename(file_path)
-
-            if pattern in filename:
-                new_filename = filename.replace(pattern, replace)
-                new_file_path = os.path.join(folder, new_filename)
-
-                try:
-                    os.rename(file_path, new_file_path)
-                    self.log_output.append(f"Renamed: {filename} ➔ {new_filename}")
-                    renamed_count += 1
-                except Exception as e:
-                    self.log_output.append(f"Failed to rename {filename}: {e}")
-
-        self.log_output.append(f"{renamed_count} file(s) renamed.")
+        # Compile the pattern once for all files; also validates group
+        # references in the replacement text
+        regex = None
+        if self.regex_checkbox.isChecked():
+            try:
+                regex = re.compile(pattern)
+                regex.sub(replace, "")
+            except (re.error, IndexError) as e:
+                self.log_output.append(f"Invalid regular expression: {e}")
+                return
+
+        # Rename in a background thread so the GUI stays responsive
+        self.set_controls_enabled(False)
+        self._rename_thread = QThread(self)
+        self._rename_worker = RenameWorker(self.files, pattern, replace, regex)
+        self._rename_worker.moveToThread(self._rename_thread)
+        self._rename_thread.started.connect(self._rename_worker.run)
+        self._rename_worker.progress.connect(self.append_log)
+        self._rename_worker.finished.connect(self.rename_finished)
+        self._rename_worker.finished.connect(self._rename_thread.quit)
+        self._rename_thread.finished.connect(self.rename_thread_finished)
+        self._rename_thread.finished.connect(self._rename_worker.deleteLater)
+        self._rename_thread.finished.connect(self._rename_thread.deleteLater)
+        self._rename_thread.start()
+
+    @pyqtSlot(int)
+    def rename_finished(self, renamed_count):
+        self.append_log([f"{renamed_count} file(s) renamed."])
         self.clear_files()
+        self.set_controls_enabled(True)
+
+    @pyqtSlot()
+    def rename_thread_finished(self):
+        # Only drop the references once the thread has actually stopped
+        self._rename_thread = None
+        self._rename_worker = None
+
+    def closeEvent(self, event):
+        # Closing the window would destroy the still running rename thread
+        if self._rename_thread is not None:
+            self.append_log(["Renaming in progress, please wait until it has finished."])
+            event.ignore()
+        else:
+            event.accept()
+
+    def set_controls_enabled(self, enabled):
+        # Block new drops and buttons while a rename is running
+        self.process_button.setEnabled(enabled)
+        self.cancel_button.setEnabled(enabled)
+        self.drop_area.setEnabled(enabled)
+
+    @pyqtSlot(list)
+    def append_log(self, lines):
+        # Insert all lines with a single cursor edit instead of one append per line
+        text = "\n".join(lines)
+        if not self.log_output.document().isEmpty():
+            text = "\n" + text
+        cursor = self.log_output.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+        self.log_output.setTextCursor(cursor)
 
     def clear_files(self):
         # Clear file list and reset UI
         self.files.clear()
+        self._files_set.clear()
         self.drop_area.clear()
         self.update_file_count()
 